@@ -0,0 +1,60 @@
+"""Optional numba-accelerated kernels for the hot fitting paths.
+
+numba is not a required dependency; when it is missing the pure NumPy
+fallbacks are used and behavior is unchanged.
+"""
+
+import numpy as np
+
+__all__ = ["HAS_CUPY", "HAS_NUMBA", "build_XtWX_XtWy"]
+
+try:
+    from numba import njit
+
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+try:
+    import cupy
+
+    HAS_CUPY = True
+except ImportError:
+    cupy = None
+    HAS_CUPY = False
+
+
+def _build_XtWX_XtWy_loop(X, y, inv_var):
+    """Fused single-pass accumulation of X^T W X and X^T W y.
+
+    One pass over X with O(width^2) accumulators, exploiting the symmetry
+    of X^T W X and avoiding the weighted-matrix temporary NumPy would
+    allocate. Only fast when compiled with numba.
+    """
+    n, w = X.shape
+    XtWX = np.zeros((w, w))
+    XtWy = np.zeros(w)
+    for i in range(n):
+        vi = inv_var[i]
+        yi = y[i]
+        for j in range(w):
+            xw = X[i, j] * vi
+            XtWy[j] += xw * yi
+            for k in range(j, w):
+                XtWX[j, k] += xw * X[i, k]
+    for j in range(w):
+        for k in range(j):
+            XtWX[j, k] = XtWX[k, j]
+    return XtWX, XtWy
+
+
+def _build_XtWX_XtWy_numpy(X, y, inv_var):
+    """NumPy fallback for `build_XtWX_XtWy`."""
+    XW = X * inv_var[:, None]
+    return X.T.dot(XW), XW.T.dot(y)
+
+
+if HAS_NUMBA:
+    build_XtWX_XtWy = njit(cache=True, fastmath=True)(_build_XtWX_XtWy_loop)
+else:
+    build_XtWX_XtWy = _build_XtWX_XtWy_numpy
@@ -139,6 +139,11 @@ class BoundedGenerator(MathMixins, StackedIndependentGenerator):
     def fit(self, *args, **kwargs):
         self.fit_mu, self.fit_sigma = self._fit(*args, **kwargs)
 
+    def _distribute_fit(self, distribute_cov=True):
+        # __getitem__ builds items from the top-level fit on demand; nothing
+        # is stored on sub-generators.
+        pass
+
     @property
     def table_properties(self):
         return [
@@ -170,6 +175,9 @@ class BoundedGenerator(MathMixins, StackedIndependentGenerator):
             setattr(
                 g, attr, getattr(self, attr).reshape((self.nbounds, self.width // self.nbounds))[key]
             )
+        # Assigning the coefficients directly bypasses _fit, so drop the
+        # copied generator's cached LaTeX table by hand.
+        g._table_properties_cache = None
         return g
 
     def __len__(self):
@@ -104,6 +104,11 @@ class StackedIndependentGenerator(Generator):
     def __getitem__(self, key):
         return self.generators[key]
 
+    def copy(self):
+        new = super().copy()
+        new.generators = [g.copy() for g in self.generators]
+        return new
+
     # def __add__(self, other):
     #     if isinstance(other, Generator):
     #         return VStackedGenerator(*self.generators, other)
@@ -183,20 +188,40 @@ class StackedIndependentGenerator(Generator):
             new[idx].prior_sigma = new[idx].fit_sigma.copy()
         return new
 
-    def fit(self, *args, **kwargs):
-        self.fit_mu, self.fit_sigma = self._fit(*args, **kwargs)
-        lengths = [g.width for g in self.generators]
-        mu, sigma = (
-            np.array_split(self.fit_mu, np.cumsum(lengths))[:-1],
-            np.array_split(self.fit_sigma, np.cumsum(lengths))[:-1],
-        )
-        for idx, mu0, sigma0 in zip(np.arange(len(mu)), mu, sigma):
-            self[idx].fit_mu = mu0
-            self[idx].fit_sigma = sigma0
+    def _distribute_fit(self, distribute_cov=True):
+        """Assign each sub-generator its block of the joint fit.
 
+        `fit_mu` is 2D after a batched fit, so blocks are always cut along
+        the last (coefficient) axis."""
         indices = np.cumsum([0, *[g.width for g in self.generators]])
         for idx, a, b in zip(range(len(indices) - 1), indices[:-1], indices[1:]):
-            self[idx].cov = self.cov[a:b, a:b]
+            self[idx].fit_mu = self.fit_mu[..., a:b]
+            self[idx].fit_sigma = self.fit_sigma[..., a:b]
+            # Assigning the coefficients directly bypasses the sub-generator's
+            # _fit, so drop its cached LaTeX table by hand.
+            self[idx]._table_properties_cache = None
+            if distribute_cov:
+                self[idx].cov = self.cov[a:b, a:b]
+            else:
+                # No joint covariance is available; drop anything left over
+                # from an earlier fit rather than serve it stale.
+                self[idx].cov = None
+
+    def fit(self, *args, **kwargs):
+        self.fit_mu, self.fit_sigma = self._fit(*args, **kwargs)
+        self._distribute_fit()
+
+    def refit(self, data):
+        super().refit(data)
+        self._distribute_fit()
+
+    def fit_batch(self, data_batch, errors_batch=None, mask=None, *args, **kwargs):
+        super().fit_batch(
+            data_batch, *args, errors_batch=errors_batch, mask=mask, **kwargs
+        )
+        # fit_batch keeps no joint covariance, so only the coefficient
+        # blocks are handed down.
+        self._distribute_fit(distribute_cov=False)
 
     def __len__(self):
         return len(self.generators)
@@ -278,6 +303,11 @@ class StackedDependentGenerator(StackedIndependentGenerator):
     def fit(self, *args, **kwargs):
         self.fit_mu, self.fit_sigma = self._fit(*args, **kwargs)
 
+    def _distribute_fit(self, distribute_cov=True):
+        # The coefficients of a dependent stack are not separable into the
+        # sub-generators; there is nothing to distribute.
+        pass
+
     # @property
     # def mu(self):
     #     return self.prior_mu if self.fit_mu is None else self.fit_mu
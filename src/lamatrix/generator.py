@@ -3,11 +3,14 @@
 import json
 import math
 from abc import ABC, abstractmethod
-from copy import deepcopy
 
 import numpy as np
+from scipy import sparse
+from scipy.linalg import cho_solve, solve_triangular
+from scipy.linalg.blas import dgemv, dsyrk
 
 from . import _META_DATA
+from ._fastpath import HAS_CUPY, HAS_NUMBA, build_XtWX_XtWy, cupy
 
 __all__ = ["Generator"]
 
@@ -18,7 +21,13 @@ class Generator(ABC):
             if not isinstance(arg, str):
                 raise ValueError("Argument names must be strings.")
 
-    def _validate_priors(self, prior_mu, prior_sigma, offset_prior=None):
+    def _validate_priors(
+        self, prior_mu, prior_sigma, offset_prior=None, dtype=np.float64
+    ):
+        # float32 halves the memory bandwidth of the design-matrix work for
+        # large over-determined problems; the triangular solve itself is
+        # always done in float64 (see `_fit`).
+        self.dtype = np.dtype(dtype)
         if prior_mu is None:
             self.prior_mu = np.zeros(self.width)
         else:
@@ -51,17 +60,53 @@ class Generator(ABC):
             self.prior_mu[0] = self.offset_prior[0]
             self.prior_sigma[0] = self.offset_prior[1]
 
+    def _get_prior_weights(self):
+        """Return the prior weight (1/sigma), precision (1/sigma^2),
+        weighted prior mean (mu/sigma) and prior bias (mu/sigma^2) vectors.
+
+        These are fixed until the priors change, so they are cached against
+        a stored copy of the current prior vectors rather than rebuilt on
+        every fit. Both reassigning and mutating `prior_mu`/`prior_sigma`
+        in place invalidate the cache; the vectors are only `width` long,
+        so the content check is cheap."""
+        prior_mu, prior_sigma = self.prior_mu, self.prior_sigma
+        cached = getattr(self, "_prior_cache", None)
+        if cached is not None:
+            if np.array_equal(cached[0], prior_mu) & np.array_equal(
+                cached[1], prior_sigma
+            ):
+                return cached[2:]
+        prior_weight = 1 / np.asarray(prior_sigma, dtype=float)
+        # A zero prior width pins the coefficient to the prior mean; use a
+        # large finite weight so the factorization stays finite.
+        prior_weight[np.isinf(prior_weight)] = 1e14
+        prior_prec = prior_weight**2
+        prior_b = np.nan_to_num(np.asarray(prior_mu) * prior_weight)
+        prior_bias = prior_weight * prior_b
+        self._prior_cache = (
+            np.array(prior_mu, dtype=float),
+            np.array(prior_sigma, dtype=float),
+            prior_weight,
+            prior_prec,
+            prior_b,
+            prior_bias,
+        )
+        return prior_weight, prior_prec, prior_b, prior_bias
+
     def update_priors(self):
         if self.fit_mu is None:
             raise ValueError("Can not update priors before fitting.")
         self.prior_mu = self.fit_mu.copy()
         self.prior_sigma = self.fit_sigma.copy()
+        self._table_properties_cache = None
         return
 
     def _create_save_data(self):
         def process(arg):
             if arg is None:
                 return None
+            elif isinstance(arg, np.dtype):
+                return str(arg)
             elif isinstance(arg, (str, int, float, list, tuple)):
                 if arg is np.inf:
                     return "Infinity"
@@ -97,7 +142,17 @@ class Generator(ABC):
             json.dump(data_to_store, json_file, indent=4)
 
     def copy(self):
-        return deepcopy(self)
+        """Shallow copy that duplicates only the prior and fit arrays.
+
+        Avoids deep-copying large cached matrices (covariance, design
+        matrices, factorizations), which can be rebuilt on demand."""
+        new = self.__class__.__new__(self.__class__)
+        new.__dict__.update(self.__dict__)
+        for attr in ["prior_mu", "prior_sigma", "fit_mu", "fit_sigma"]:
+            value = new.__dict__.get(attr)
+            if isinstance(value, np.ndarray):
+                new.__dict__[attr] = value.copy()
+        return new
 
     def __repr__(self):
         fit = "fit" if self.fit_mu is not None else ""
@@ -133,16 +188,40 @@ class Generator(ABC):
 
         return formatted_mean, formatted_error
 
+    @staticmethod
+    def _format_significant_figures_vec(means, errors):
+        """Vectorized version of `format_significant_figures` that formats
+        whole coefficient arrays in one pass."""
+        means = np.atleast_1d(np.asarray(means, dtype=float))
+        errors = np.atleast_1d(np.asarray(errors, dtype=float))
+        bad = ~(np.isfinite(means) & np.isfinite(errors))
+        ok = ~bad & (errors != 0)
+        sig_figures = np.zeros(means.shape, int)
+        sig_figures[ok] = np.maximum(
+            0, -np.floor(np.log10(np.abs(errors[ok]))).astype(int)
+        )
+        return [
+            ("0", "\\infty") if b else (f"{m:.{s}f}", f"{e:.{s}f}")
+            for m, e, s, b in zip(means, errors, sig_figures, bad)
+        ]
+
     def _get_table_matter(self):
+        properties = self.table_properties
+        fit_strings = self._format_significant_figures_vec(
+            [fit[0] for _, fit, _ in properties],
+            [fit[1] for _, fit, _ in properties],
+        )
+        prior_strings = self._format_significant_figures_vec(
+            [np.nan if prior is None else prior[0] for *_, prior in properties],
+            [np.nan if prior is None else prior[1] for *_, prior in properties],
+        )
         table_matter = []
-        for symbol, fit, prior in self.table_properties:
-            formatted_fit_mean, formatted_fit_error = self.format_significant_figures(
-                *fit
-            )
+        for (symbol, _, prior), fit_str, prior_str in zip(
+            properties, fit_strings, prior_strings
+        ):
+            formatted_fit_mean, formatted_fit_error = fit_str
             if prior is not None:
-                formatted_prior_mean, formatted_prior_error = (
-                    self.format_significant_figures(*prior)
-                )
+                formatted_prior_mean, formatted_prior_error = prior_str
             else:
                 formatted_prior_mean = ""
                 formatted_prior_error = ""
@@ -164,27 +243,224 @@ class Generator(ABC):
     def to_latex(self):
         return "\n".join([self.equation, self._to_latex_table()])
 
+    def _cached_design_matrix(self, *args, **kwargs):
+        """Build the design matrix, memoizing on the identity of the inputs.
+
+        Repeated calls with the same array objects (e.g. `fit` then
+        `evaluate` on one grid) skip rebuilding potentially expensive bases
+        such as splines. Pass the same arrays to benefit from the cache; the
+        key is input identity, not value. The key holds references to the
+        inputs themselves and compares with `is`, so a freed array whose
+        `id` is recycled by the allocator can never alias a different
+        grid."""
+        names = tuple(sorted(kwargs))
+        values = tuple(kwargs[name] for name in names)
+        cached = getattr(self, "_X_cache_key", None)
+        if cached is not None:
+            cached_args, cached_names, cached_values = cached
+            if (
+                (cached_names == names)
+                & (len(cached_args) == len(args))
+                and all(a is b for a, b in zip(cached_args, args))
+                and all(a is b for a, b in zip(cached_values, values))
+            ):
+                return self._X_cache
+        self._X_cache = self.design_matrix(*args, **kwargs)
+        self._X_cache_key = (args, names, values)
+        return self._X_cache
+
     def _fit(self, data, errors=None, mask=None, *args, **kwargs):
-        X = self.design_matrix(*args, **kwargs)
+        X = self._cached_design_matrix(*args, **kwargs)
+        # data may also be a stack of K datasets sharing the same grid,
+        # errors and mask; all K regressions then share one factorization
+        # and are solved with a single matrix right-hand side.
+        nbatch = None
         if np.prod(data.shape) != X.shape[0]:
-            raise ValueError(f"Data must have shape {X.shape[0]}")
+            if (data.ndim > 1) & (np.prod(data.shape[1:]) == X.shape[0]):
+                nbatch = data.shape[0]
+            else:
+                raise ValueError(f"Data must have shape {X.shape[0]}")
         if errors is None:
-            errors = np.ones_like(data)
-        if mask is None:
-            mask = np.ones(np.prod(data.shape), bool)
+            errors = np.ones(X.shape[0]) if nbatch is not None else np.ones_like(data)
         self.data_shape = data.shape
-        mask = mask.ravel()
-        sigma_w_inv = X[mask].T.dot(
-            X[mask] / errors.ravel()[mask, None] ** 2
-        ) + np.diag(1 / self.prior_sigma**2)
-        self.cov = np.linalg.inv(sigma_w_inv)
-        B = X[mask].T.dot(
-            data.ravel()[mask] / errors.ravel()[mask] ** 2
-        ) + np.nan_to_num(self.prior_mu / self.prior_sigma**2)
-        fit_mu = np.linalg.solve(sigma_w_inv, B)
-        fit_sigma = self.cov.diagonal() ** 0.5
+        self._table_properties_cache = None
+        if mask is not None:
+            mask = mask.ravel()
+            if mask.all():
+                # An all-True mask is a no-op; treating it as one skips a
+                # full fancy-index copy of X.
+                mask = None
+            else:
+                index = np.flatnonzero(mask)
+                if len(index) > 0:
+                    if index[-1] - index[0] + 1 == len(index):
+                        # Contiguous masks can slice instead of fancy
+                        # indexing, which avoids copying X.
+                        mask = slice(index[0], index[-1] + 1)
+        # Weighted design matrix, augmented with a Tikhonov block for the priors.
+        # Solving the augmented system by QR avoids forming X^T X, which squares
+        # the condition number, and replaces the inverse + solve with a single
+        # triangular solve.
+        # Take the boolean-compressed views once; each fancy index is a full
+        # copy, so repeating them costs O(N w) memory traffic.
+        dtype = np.dtype(getattr(self, "dtype", np.float64))
+        if X.dtype != dtype:
+            X = X.astype(dtype)
+        if mask is None:
+            Xm, em = X, errors.ravel()
+        else:
+            Xm, em = X[mask], errors.ravel()[mask]
+        em = em.astype(dtype, copy=False)
+        is_sparse = sparse.issparse(Xm)
+        if is_sparse & (Xm.shape[0] < self.width):
+            # Too few points for sparsity to pay off; densify and use the
+            # minimum-norm SVD path below.
+            Xm = Xm.toarray()
+            is_sparse = False
+        if is_sparse:
+            Xw = Xm.multiply(1 / em[:, None]).tocsr()
+        else:
+            Xw = Xm / em[:, None]
+        if nbatch is None:
+            dm = data.ravel() if mask is None else data.ravel()[mask]
+            yw = dm.astype(dtype, copy=False) / em
+        else:
+            dm = data.reshape(nbatch, -1)
+            if mask is not None:
+                dm = dm[:, mask]
+            yw = (dm.astype(dtype, copy=False) / em).T
+        prior_weight, prior_prec, prior_b, prior_bias = self._get_prior_weights()
+        if is_sparse:
+            # Sparse bases (e.g. banded spline matrices) waste most of the
+            # dense GEMM's flops on zeros; form the normal equations
+            # sparse-sparse so the cost scales with nnz, and factorize the
+            # small (still banded) dense result directly.
+            XtWX = np.asarray((Xw.T @ Xw).toarray(), dtype=np.float64)
+            XtWX[np.diag_indices_from(XtWX)] += prior_prec
+            XtWy = np.asarray(Xw.T @ yw, dtype=np.float64)
+            L = np.linalg.cholesky(XtWX)
+            fit_mu = cho_solve(
+                (L, True),
+                XtWy + (prior_bias if nbatch is None else prior_bias[:, None]),
+            )
+            self._R = L.T
+            self._cov = None
+            Rinv = solve_triangular(self._R, np.eye(self.width))
+            fit_sigma = np.sqrt(np.einsum("ij,ij->i", Rinv, Rinv))
+            self._Xw = Xw
+            self._fit_mask = mask
+            self._fit_errors = em
+            self._fit_npoints = X.shape[0]
+            self._prior_B = prior_bias
+            if nbatch is not None:
+                fit_mu = fit_mu.T
+                fit_sigma = np.tile(fit_sigma, (nbatch, 1))
+            return fit_mu, fit_sigma
+        if (
+            HAS_NUMBA
+            & (nbatch is None)
+            & (self.width <= 50)
+            & (Xm.shape[0] >= self.width)
+        ):
+            # Small-width models are dominated by NumPy dispatch and
+            # temporaries rather than flops; use the fused single-pass
+            # normal-equations kernel. The Cholesky factor of the posterior
+            # precision plays the same role as R from the QR path below.
+            # Design matrices built as vstack(...).T are F-contiguous, which
+            # makes the kernel's row-wise pass stride through memory; copy
+            # to C order once instead.
+            Xm = np.ascontiguousarray(Xm)
+            inv_var = 1 / em**2
+            XtWX, XtWy = build_XtWX_XtWy(Xm, np.asarray(dm, dtype=float), inv_var)
+            XtWX[np.diag_indices_from(XtWX)] += prior_prec
+            try:
+                L = np.linalg.cholesky(XtWX)
+            except np.linalg.LinAlgError:
+                # Pinned coefficients (zero prior sigma) put ~1e28 on the
+                # diagonal, and the mixed scales can push LAPACK's Cholesky
+                # past its positive-definite tolerance when columns are
+                # collinear. The augmented QR below never squares the
+                # weights, so fall through to it.
+                L = None
+            if L is not None:
+                fit_mu = cho_solve((L, True), XtWy + prior_bias)
+                self._R = L.T
+                self._cov = None
+                Rinv = solve_triangular(self._R, np.eye(self.width))
+                fit_sigma = np.sqrt(np.einsum("ij,ij->i", Rinv, Rinv))
+                self._Xw = Xw
+                self._fit_mask = mask
+                self._fit_errors = em
+                self._fit_npoints = X.shape[0]
+                self._prior_B = prior_bias
+                return fit_mu, fit_sigma
+        A = np.vstack([Xw, np.diag(prior_weight.astype(dtype, copy=False))])
+        prior_b = prior_b.astype(dtype, copy=False)
+        if nbatch is None:
+            b = np.concatenate([yw, prior_b])
+        else:
+            b = np.vstack([yw, np.tile(prior_b[:, None], (1, nbatch))])
+        if Xm.shape[0] < self.width:
+            # With fewer unmasked data points than basis vectors the
+            # augmented system is rank deficient wherever priors are
+            # unbounded; take the minimum-norm solution through an SVD and
+            # build the covariance from the pseudo-inverse.
+            U, s, Vt = np.linalg.svd(A, full_matrices=False)
+            keep = s > (np.finfo(float).eps * np.max(A.shape) * s[0])
+            Ub = U[:, keep].T.dot(b)
+            fit_mu = Vt[keep].T.dot(
+                Ub / (s[keep] if np.ndim(b) == 1 else s[keep][:, None])
+            )
+            Vs = Vt[keep].T / s[keep]
+            self._R = None
+            self._cov = Vs.dot(Vs.T)
+            fit_sigma = np.sqrt(np.einsum("ij,ij->i", Vs, Vs))
+        else:
+            Q, R = np.linalg.qr(A, mode="reduced")
+            # Promote only the small (width^2) triangular system to float64;
+            # the O(N width^2) factorization runs in the chosen dtype.
+            R = R.astype(np.float64, copy=False)
+            fit_mu = solve_triangular(R, Q.T.dot(b).astype(np.float64, copy=False))
+            self._R = R
+            self._cov = None
+            # diag(cov) = row norms of R^-1, no need to materialize the full
+            # covariance matrix here.
+            Rinv = solve_triangular(R, np.eye(R.shape[0]))
+            fit_sigma = np.sqrt(np.einsum("ij,ij->i", Rinv, Rinv))
+        # Stash the weighted system so `refit` can reuse the factorization
+        # for new data on the same grid, errors and mask.
+        self._Xw = Xw
+        self._fit_mask = mask
+        self._fit_errors = em
+        self._fit_npoints = X.shape[0]
+        self._prior_B = prior_bias
+        if nbatch is not None:
+            # The K datasets share errors and mask, so they share fit_sigma.
+            fit_mu = fit_mu.T
+            fit_sigma = np.tile(fit_sigma, (nbatch, 1))
         return fit_mu, fit_sigma
 
+    @property
+    def cov(self):
+        """Covariance matrix of the fit coefficients, built lazily from the
+        triangular factor stored by `_fit`."""
+        if getattr(self, "_cov", None) is None:
+            if getattr(self, "_R", None) is None:
+                raise AttributeError(
+                    "Can not build a covariance matrix before fitting."
+                )
+            Rinv = solve_triangular(self._R, np.eye(self._R.shape[0]))
+            self._cov = Rinv.dot(Rinv.T)
+        return self._cov
+
+    @cov.setter
+    def cov(self, value):
+        # An explicitly assigned covariance (e.g. a block handed down by a
+        # stacked fit) supersedes any factor left over from an earlier
+        # standalone fit; drop it so `sample` and `cov` use the assignment.
+        self._cov = value
+        self._R = None
+
     @property
     def mu(self):
         return self.prior_mu if self.fit_mu is None else self.fit_mu
@@ -193,32 +469,171 @@ class Generator(ABC):
     def sigma(self):
         return self.prior_sigma if self.fit_sigma is None else self.fit_sigma
 
+    def refit(self, data):
+        """Fit new data on the grid, errors and mask of the previous fit.
+
+        Reuses the design matrix and triangular factor stored by the last
+        fit, so only a matrix-vector product and two triangular solves are
+        performed instead of a full factorization. `fit_sigma` is unchanged
+        because the errors and mask are unchanged."""
+        if getattr(self, "_R", None) is None:
+            raise ValueError("Can not refit before fitting.")
+        nbatch = None
+        if np.prod(data.shape) != self._fit_npoints:
+            if (data.ndim > 1) & (np.prod(data.shape[1:]) == self._fit_npoints):
+                nbatch = data.shape[0]
+            else:
+                raise ValueError(f"Data must have shape {self._fit_npoints}")
+        if nbatch is None:
+            dm = data.ravel() if self._fit_mask is None else data.ravel()[self._fit_mask]
+            B = self._Xw.T.dot(dm / self._fit_errors) + self._prior_B
+        else:
+            dm = data.reshape(nbatch, -1)
+            if self._fit_mask is not None:
+                dm = dm[:, self._fit_mask]
+            B = self._Xw.T.dot((dm / self._fit_errors).T) + self._prior_B[:, None]
+        # R^T R is the posterior precision, so R acts as its Cholesky factor;
+        # cho_solve dispatches to LAPACK's single SPD solve (potrs).
+        fit_mu = cho_solve((self._R, False), B)
+        self.fit_mu = fit_mu.T if nbatch is not None else fit_mu
+        self.data_shape = data.shape
+        self._table_properties_cache = None
+
+    def fit_batch(self, data_batch, errors_batch=None, mask=None, *args, **kwargs):
+        """Fit K independent datasets with per-dataset errors in one batched solve.
+
+        Unlike passing stacked data to `fit` (which shares errors and mask
+        across the stack), each dataset here carries its own weights, so a
+        normal-equations matrix is built per dataset and the whole (K,
+        width, width) tensor is factorized with batched Cholesky solves.
+        Runs on the GPU through CuPy when it is installed; otherwise NumPy's
+        stacked linalg is used. Sets `fit_mu` and `fit_sigma` with shape
+        (K, width)."""
+        xp = cupy if HAS_CUPY else np
+        X = self._cached_design_matrix(*args, **kwargs)
+        if sparse.issparse(X):
+            X = X.toarray()
+        data_batch = np.asarray(data_batch)
+        nbatch = data_batch.shape[0]
+        data2 = data_batch.reshape(nbatch, -1)
+        if data2.shape[1] != X.shape[0]:
+            raise ValueError(f"Data must have shape (K, {X.shape[0]})")
+        if errors_batch is None:
+            errors2 = np.ones_like(data2)
+        else:
+            errors2 = np.asarray(errors_batch).reshape(nbatch, -1)
+        if mask is not None:
+            mask = mask.ravel()
+            X, data2, errors2 = X[mask], data2[:, mask], errors2[:, mask]
+        prior_weight, prior_prec, prior_b, prior_bias = self._get_prior_weights()
+
+        Xd = xp.asarray(X)
+        d = xp.asarray(data2)
+        inv_var = 1 / xp.asarray(errors2) ** 2
+        if HAS_CUPY:
+            XtWX = xp.einsum("nj,bn,nk->bjk", Xd, inv_var, Xd)
+        else:
+            # Each X^T W X is symmetric, so syrk on the sqrt-weighted matrix
+            # does the rank-k update at half the flops of the einsum/gemm
+            # contraction; only the upper triangle comes back, so mirror it.
+            Xc = np.ascontiguousarray(Xd, dtype=np.float64)
+            sqrt_w = np.sqrt(inv_var)
+            XtWX = np.empty((nbatch, self.width, self.width))
+            for idx in range(nbatch):
+                XtWX[idx] = dsyrk(1.0, Xc * sqrt_w[idx][:, None], trans=1)
+            lower = np.tril_indices(self.width, -1)
+            XtWX[:, lower[0], lower[1]] = XtWX[:, lower[1], lower[0]]
+        diag = xp.arange(self.width)
+        XtWX[:, diag, diag] += xp.asarray(prior_prec)
+        B = xp.einsum("nj,bn->bj", Xd, d * inv_var) + xp.asarray(
+            prior_bias
+        )[None, :]
+        L = xp.linalg.cholesky(XtWX)
+        Linv = xp.linalg.solve(
+            L, xp.broadcast_to(xp.eye(self.width), L.shape)
+        )
+        fit_mu = xp.einsum(
+            "bji,bj->bi", Linv, xp.einsum("bij,bj->bi", Linv, B)
+        )
+        fit_sigma = xp.sqrt((Linv**2).sum(axis=1))
+        if HAS_CUPY:
+            fit_mu, fit_sigma = cupy.asnumpy(fit_mu), cupy.asnumpy(fit_sigma)
+        self.fit_mu = fit_mu
+        self.fit_sigma = fit_sigma
+        self.data_shape = data_batch.shape
+        self._R = None
+        self._cov = None
+        self._table_properties_cache = None
+
     def evaluate(self, *args, **kwargs):
-        X = self.design_matrix(*args, **kwargs)
+        X = self._cached_design_matrix(*args, **kwargs)
+        mu = np.asarray(self.mu)
+        if mu.ndim == 2:
+            # Batched fit: one model per row of mu. X.dot keeps this valid
+            # for sparse design matrices too.
+            model = X.dot(mu.T).T
+            if self.data_shape is not None:
+                if model.size == np.prod(self.data_shape):
+                    return model.reshape(self.data_shape)
+            return model
         if self.data_shape is not None:
             if X.shape[0] == np.prod(self.data_shape):
-                return X.dot(self.mu).reshape(self.data_shape)
-        return X.dot(self.mu)
+                return X.dot(mu).reshape(self.data_shape)
+        return X.dot(mu)
 
     def __call__(self, *args, **kwargs):
         return self.evaluate(*args, **kwargs)
 
+    def residuals(self, data, *args, **kwargs):
+        """Compute `data - evaluate(...)` in one fused BLAS call.
+
+        The matrix-vector product and the subtraction are folded into a
+        single gemv with alpha=-1, beta=1 acting on a copy of the data,
+        halving the memory traffic of building the model and then
+        differencing it."""
+        X = self._cached_design_matrix(*args, **kwargs)
+        mu = np.asarray(self.mu, dtype=np.float64)
+        if (mu.ndim == 2) | sparse.issparse(X):
+            # Batched fits and sparse bases fall back to the unfused path.
+            return data - self.evaluate(*args, **kwargs)
+        if np.prod(data.shape) != X.shape[0]:
+            raise ValueError(f"Data must have shape {X.shape[0]}")
+        y = data.ravel().astype(np.float64)
+        r = dgemv(-1.0, X, mu, beta=1.0, y=y, overwrite_y=1)
+        return r.reshape(data.shape)
+
     def sample(self, size=None, *args, **kwargs):
-        X = self.design_matrix(*args, **kwargs)
+        X = self._cached_design_matrix(*args, **kwargs)
+        if np.asarray(self.mu).ndim == 2:
+            raise ValueError(
+                "Can not sample from a batched fit; fit a single dataset first."
+            )
+        if getattr(self, "_R", None) is not None:
+            # cov = R^-1 R^-T, so mu + R^-1 Z draws all samples from
+            # N(mu, cov) with a single BLAS-3 triangular solve, without
+            # materializing the covariance matrix.
+            Z = np.random.standard_normal(
+                (self.width, 1 if size is None else size)
+            )
+            draws = self.mu[:, None] + solve_triangular(self._R, Z)
+            return X.dot(draws[:, 0] if size is None else draws)
         if size is None:
             return X.dot(np.random.multivariate_normal(self.mu, self.cov))
         return X.dot(np.random.multivariate_normal(self.mu, self.cov, size=size).T)
 
     @property
     def table_properties(self):
-        return [
-            (
-                "w_{idx}",
-                (self.mu[idx], self.sigma[idx]),
-                (self.prior_mu[idx], self.prior_sigma[idx]),
-            )
-            for idx in range(self.width)
-        ]
+        if getattr(self, "_table_properties_cache", None) is None:
+            self._table_properties_cache = [
+                ("w_{idx}", (mu, sigma), (prior_mu, prior_sigma))
+                for mu, sigma, prior_mu, prior_sigma in zip(
+                    np.asarray(self.mu).tolist(),
+                    np.asarray(self.sigma).tolist(),
+                    np.asarray(self.prior_mu).tolist(),
+                    np.asarray(self.prior_sigma).tolist(),
+                )
+            ]
+        return self._table_properties_cache
 
     @property
     @abstractmethod
@@ -234,14 +649,17 @@ class Generator(ABC):
 
     @property
     def equation(self):
-        func_signature = ", ".join([f"\\mathbf{{{a}}}" for a in self.arg_names])
-        return (
-            f"\\[f({func_signature}) = "
-            + " + ".join(
-                [f"{self._mu_letter}_{{{coeff}}} {e}" for coeff, e in enumerate(self._equation)]
+        # The equation only depends on the basis, not the fit; build it once.
+        if getattr(self, "_equation_cache", None) is None:
+            func_signature = ", ".join([f"\\mathbf{{{a}}}" for a in self.arg_names])
+            self._equation_cache = (
+                f"\\[f({func_signature}) = "
+                + " + ".join(
+                    [f"{self._mu_letter}_{{{coeff}}} {e}" for coeff, e in enumerate(self._equation)]
+                )
+                + "\\]"
             )
-            + "\\]"
-        )
+        return self._equation_cache
 
     @property
     def _mu_letter(self):
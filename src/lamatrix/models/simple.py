@@ -23,12 +23,15 @@ class Polynomial1DGenerator(MathMixins, Generator):
         prior_sigma=None,
         offset_prior=None,
         data_shape=None,
+        dtype=np.float64,
     ):
         self.x_name = x_name
         self._validate_arg_names()
         self.polyorder = polyorder
         self.data_shape = data_shape
-        self._validate_priors(prior_mu, prior_sigma, offset_prior=offset_prior)
+        self._validate_priors(
+            prior_mu, prior_sigma, offset_prior=offset_prior, dtype=dtype
+        )
         self.fit_mu = None
         self.fit_sigma = None
 
@@ -53,6 +56,7 @@ class Polynomial1DGenerator(MathMixins, Generator):
             "offset_prior",
             "data_shape",
             "polyorder",
+            "dtype",
         ]
 
     def design_matrix(self, *args, **kwargs):
@@ -70,7 +74,7 @@ class Polynomial1DGenerator(MathMixins, Generator):
         """
         if not self.arg_names.issubset(set(kwargs.keys())):
             raise ValueError(f"Expected {self.arg_names} to be passed.")
-        x = kwargs.get(self.x_name).ravel()
+        x = kwargs.get(self.x_name).ravel().astype(self.dtype, copy=False)
         return np.vstack([x**idx for idx in range(self.polyorder + 1)]).T
 
     def fit(self, *args, **kwargs):
@@ -209,12 +213,15 @@ class SinusoidGenerator(MathMixins, Generator):
         prior_sigma=None,
         offset_prior=None,
         data_shape=None,
+        dtype=np.float64,
     ):
         self.nterms = nterms
         self.data_shape = data_shape
         self.x_name = x_name
         self._validate_arg_names()
-        self._validate_priors(prior_mu, prior_sigma, offset_prior=offset_prior)
+        self._validate_priors(
+            prior_mu, prior_sigma, offset_prior=offset_prior, dtype=dtype
+        )
         self.fit_mu = None
         self.fit_sigma = None
 
@@ -239,6 +246,7 @@ class SinusoidGenerator(MathMixins, Generator):
             "offset_prior",
             "data_shape",
             "nterms",
+            "dtype",
         ]
 
     def design_matrix(self, *args, **kwargs):
@@ -256,7 +264,7 @@ class SinusoidGenerator(MathMixins, Generator):
         """
         if not self.arg_names.issubset(set(kwargs.keys())):
             raise ValueError(f"Expected {self.arg_names} to be passed.")
-        x = kwargs.get(self.x_name).ravel()
+        x = kwargs.get(self.x_name).ravel().astype(self.dtype, copy=False)
         return np.vstack(
             [
                 x**0,
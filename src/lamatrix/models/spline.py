@@ -1,6 +1,7 @@
 """Generator objects for different types of models"""
 
 import numpy as np
+from scipy import sparse as sp
 
 from ..generator import Generator
 from ..math import MathMixins
@@ -73,6 +74,8 @@ class Spline1DGenerator(MathMixins, SplineMixins, Generator):
         prior_sigma=None,
         offset_prior=None,
         data_shape=None,
+        dtype=np.float64,
+        sparse: bool = False,
     ):
         # Check if knots are padded
         if not (len(np.unique(knots[:splineorder])) == 1) & (
@@ -86,7 +89,10 @@ class Spline1DGenerator(MathMixins, SplineMixins, Generator):
         self._validate_arg_names()
         self.splineorder = splineorder
         self.data_shape = data_shape
-        self._validate_priors(prior_mu, prior_sigma, offset_prior=offset_prior)
+        self.sparse = sparse
+        self._validate_priors(
+            prior_mu, prior_sigma, offset_prior=offset_prior, dtype=dtype
+        )
         self.fit_mu = None
         self.fit_sigma = None
 
@@ -112,6 +118,8 @@ class Spline1DGenerator(MathMixins, SplineMixins, Generator):
             "prior_sigma",
             "offset_prior",
             "data_shape",
+            "dtype",
+            "sparse",
         ]
 
     def design_matrix(self, *args, **kwargs):
@@ -124,21 +132,46 @@ class Spline1DGenerator(MathMixins, SplineMixins, Generator):
 
         Returns
         -------
-        X : np.ndarray
-            Design matrix with shape (len(x), self.nvectors)
+        X : np.ndarray or scipy.sparse.csr_matrix
+            Design matrix with shape (len(x), self.nvectors). A CSR matrix
+            when the generator was built with `sparse=True`.
         """
         if not self.arg_names.issubset(set(kwargs.keys())):
             raise ValueError(f"Expected {self.arg_names} to be passed.")
         x = kwargs.get(self.x_name).ravel()
 
+        if self.sparse:
+            # Each basis function is only nonzero on [t_i, t_{i+k}), so the
+            # matrix has at most `splineorder` nonzeros per row; only
+            # evaluate the basis on its support and store the result as CSR.
+            rows, cols, vals = [], [], []
+            for i in range(self.width - 1):
+                support = np.flatnonzero(
+                    (x >= self.knots[i]) & (x < self.knots[i + self.splineorder])
+                )
+                for j in support:
+                    v = self.bspline_basis(
+                        k=self.splineorder, i=i, t=self.knots, x=x[j]
+                    )
+                    if v != 0:
+                        rows.append(j)
+                        cols.append(i + 1)
+                        vals.append(v)
+            rows.extend(range(len(x)))
+            cols.extend([0] * len(x))
+            vals.extend([1.0] * len(x))
+            return sp.csr_matrix(
+                (vals, (rows, cols)), shape=(len(x), self.width), dtype=self.dtype
+            )
+
         # Set up the least squares problem
-        X = np.zeros((len(x), self.width - 1))
+        X = np.zeros((len(x), self.width - 1), dtype=self.dtype)
         for i in range(self.width - 1):
             for j, xi in enumerate(x):
                 X[j, i] = self.bspline_basis(
                     k=self.splineorder, i=i, t=self.knots, x=xi
                 )
-        return np.hstack([np.ones((len(x), 1)), X])
+        return np.hstack([np.ones((len(x), 1), dtype=self.dtype), X])
 
     def fit(self, *args, **kwargs):
         self.fit_mu, self.fit_sigma = self._fit(*args, **kwargs)
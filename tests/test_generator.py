@@ -170,6 +170,87 @@ def test_spline():
     assert np.allclose(true_w, model.mu)
 
 
+def test_sparse_spline():
+    from scipy import sparse
+
+    x = np.linspace(0, 10, 100)
+    y = np.random.normal(0, 0.1, 100) + np.sin(2 * x)
+    ye = np.ones(100) * 0.1
+    knots = np.linspace(x.min(), x.max(), 20)
+    dense = Spline1DGenerator(knots=knots, offset_prior=(0, 0.01))
+    sparse_g = Spline1DGenerator(knots=knots, offset_prior=(0, 0.01), sparse=True)
+    X = sparse_g.design_matrix(x=x)
+    assert sparse.issparse(X)
+    assert np.allclose(X.toarray(), dense.design_matrix(x=x))
+    dense.fit(x=x, data=y, errors=ye)
+    sparse_g.fit(x=x, data=y, errors=ye)
+    assert np.allclose(dense.fit_mu, sparse_g.fit_mu)
+    assert np.allclose(dense.fit_sigma, sparse_g.fit_sigma)
+    assert np.allclose(dense.evaluate(x=x), sparse_g.evaluate(x=x))
+
+
+def test_refit():
+    x = np.arange(-1, 1, 0.01)
+    g = Polynomial1DGenerator(polyorder=3)
+    data = 3 * x**2 + 2 * x + 1 + np.random.normal(0, 0.01, size=len(x))
+    errors = np.ones_like(x) * 0.01
+    g.fit(x=x, data=data, errors=errors)
+    first_mu = g.fit_mu.copy()
+
+    data2 = -2 * x**3 + 0.5 * x + np.random.normal(0, 0.01, size=len(x))
+    g.refit(data2)
+    g2 = Polynomial1DGenerator(polyorder=3)
+    g2.fit(x=x, data=data2, errors=errors)
+    assert np.allclose(g.fit_mu, g2.fit_mu)
+    assert not np.allclose(g.fit_mu, first_mu)
+
+
+def test_residuals():
+    x = np.arange(-1, 1, 0.01)
+    g = Polynomial1DGenerator(polyorder=2)
+    data = 3 * x**2 + 2 * x + 1 + np.random.normal(0, 0.01, size=len(x))
+    g.fit(x=x, data=data, errors=np.ones_like(x) * 0.01)
+    r = g.residuals(data, x=x)
+    assert r.shape == data.shape
+    assert np.allclose(r, data - g.evaluate(x=x))
+
+
+def test_batch_fit():
+    x = np.arange(-1, 1, 0.01)
+    g = Polynomial1DGenerator(polyorder=2)
+    true_w = np.random.normal(0, 1, size=(5, g.width))
+    data = true_w.dot(g.design_matrix(x=x).T)
+    data += np.random.normal(0, 0.01, size=data.shape)
+    errors = np.ones_like(x) * 0.01
+    g.fit(x=x, data=data, errors=errors)
+    assert g.fit_mu.shape == (5, g.width)
+    assert g.fit_sigma.shape == (5, g.width)
+    assert np.allclose(true_w, g.fit_mu, atol=g.fit_sigma * 5)
+    assert g.evaluate(x=x).shape == data.shape
+
+    g2 = Polynomial1DGenerator(polyorder=2)
+    g2.fit(x=x, data=data[2], errors=errors)
+    assert np.allclose(g2.fit_mu, g.fit_mu[2])
+
+
+def test_fit_batch():
+    x = np.arange(-1, 1, 0.01)
+    g = Polynomial1DGenerator(polyorder=2)
+    true_w = np.random.normal(0, 1, size=(5, g.width))
+    data = true_w.dot(g.design_matrix(x=x).T)
+    data += np.random.normal(0, 0.01, size=data.shape)
+    errors = np.abs(np.random.normal(0.01, 0.002, size=data.shape)) + 0.005
+    mask = np.abs(x) < 0.9
+    g.fit_batch(data, errors_batch=errors, mask=mask, x=x)
+    assert g.fit_mu.shape == (5, g.width)
+    assert g.fit_sigma.shape == (5, g.width)
+    for idx in range(5):
+        g2 = Polynomial1DGenerator(polyorder=2)
+        g2.fit(x=x, data=data[idx], errors=errors[idx], mask=mask)
+        assert np.allclose(g2.fit_mu, g.fit_mu[idx])
+        assert np.allclose(g2.fit_sigma, g.fit_sigma[idx])
+
+
 def test_save():
     p1 = Polynomial1DGenerator("c", polyorder=2)
     p2 = Polynomial1DGenerator("r")